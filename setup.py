@@ -18,5 +18,5 @@ setup(
             "loom=loom.cli:run",
         ],
     },
-    python_requires=">=3.9",
+    python_requires=">=3.10",
 )
\ No newline at end of file
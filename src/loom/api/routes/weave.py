@@ -3,6 +3,7 @@ Weave endpoint - integrates with weaver.py
 """
 from fastapi import APIRouter, HTTPException
 import json
+import logging
 import sys
 import os
 from pathlib import Path
@@ -17,6 +18,8 @@ from src.loom.graph import SemanticGraph
 from ..models.requests import WeaveRequest
 from ..models.responses import WeaveResponse, ComponentDetail
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 # Initialize graph once
@@ -39,9 +42,8 @@ def get_all_projects():
 async def weave_pattern(request: WeaveRequest):
     """Generate a pattern from requirements"""
     try:
-        print(f"Received request: {request}")  # Debug print
-        print(f"Description: {request.description}")
-        print(f"Capabilities: {request.capabilities}")
+        logger.debug("Weave request: description=%r capabilities=%s",
+                     request.description, request.capabilities)
         
         # Load projects
         projects = get_all_projects()
@@ -77,5 +79,5 @@ async def weave_pattern(request: WeaveRequest):
         )
         
     except Exception as e:
-        print(f"Error: {str(e)}")  # Debug print
+        logger.error("Weave failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -4,6 +4,10 @@ LOOM CLI - Command Line Interface for Pattern Weaver
 """
 
 import json
+from bisect import bisect_right
+from collections import Counter
+from operator import attrgetter
+from pathlib import Path
 from typing import Optional, List
 
 import typer
@@ -22,6 +26,18 @@ console = Console()
 # Global graph instance cache
 _graph_instance = None
 
+# Confidence tiers for the --why report: a score at or above
+# _CONFIDENCE_THRESHOLDS[i] maps to _CONFIDENCE_REASONS[i + 1]
+_CONFIDENCE_THRESHOLDS = (0.80, 0.85, 0.88)
+_CONFIDENCE_REASONS = (
+    "[yellow]Moderate Confidence[/yellow]: Functional approach with integration considerations",
+    "[yellow]Good Confidence[/yellow]: Reliable with minor trade-offs",
+    "[green]High Confidence[/green]: Strong compatibility with good domain fit",
+    "[green]Exceptional Confidence[/green]: Top-tier compatibility and domain alignment",
+)
+
+_link_type_and_strength = attrgetter("type", "strength")
+
 def get_graph() -> SemanticGraph:
     """Get or create the semantic graph instance."""
     global _graph_instance
@@ -195,7 +211,8 @@ def show_project(name: str = typer.Argument(..., help="Name of the project to sh
         compat_table.add_column("Strength", style="yellow", justify="right")
         
         for other, link in compat.items():
-            compat_table.add_row(other, link.type, f"{link.strength:.2f}")
+            link_type, strength = _link_type_and_strength(link)
+            compat_table.add_row(other, link_type, f"{strength:.2f}")
         
         console.print(compat_table)
 
@@ -344,14 +361,7 @@ def weave_pattern(
             console.print(f"[dim]Confidence: {confidence:.3f} | Complexity: {complexity:.3f}[/dim]")
             
             # Confidence explanation
-            if confidence >= 0.88:
-                conf_reason = "[green]Exceptional Confidence[/green]: Top-tier compatibility and domain alignment"
-            elif confidence >= 0.85:
-                conf_reason = "[green]High Confidence[/green]: Strong compatibility with good domain fit"
-            elif confidence >= 0.80:
-                conf_reason = "[yellow]Good Confidence[/yellow]: Reliable with minor trade-offs"
-            else:
-                conf_reason = "[yellow]Moderate Confidence[/yellow]: Functional approach with integration considerations" 
+            conf_reason = _CONFIDENCE_REASONS[bisect_right(_CONFIDENCE_THRESHOLDS, confidence)]
             console.print(f"• {conf_reason}")
             
             # Pattern-specific reasoning
@@ -437,8 +447,7 @@ def weave_pattern(
         # Save if requested
         if save and i == 0:  # Save first pattern
             filename = f"{save}.json" if not save.endswith('.json') else save
-            with open(filename, 'w') as f:
-                json.dump(pattern_dict, f, indent=2)
+            Path(filename).write_text(json.dumps(pattern_dict, indent=2), encoding="utf-8")
             console.print(f"[green]✅ Pattern saved to {filename}[/green]")
 
         console.print()  # Empty line between patterns
@@ -588,7 +597,7 @@ def audit_pattern(
     
     Phase 1.3 of Loom Roadmap: Audit Mode
     """
-    from loom.auditor import PatternAuditor, AuditSeverity
+    from loom.auditor import PatternAuditor
     
     graph = get_graph()
     auditor = PatternAuditor(graph)
@@ -610,11 +619,7 @@ def audit_pattern(
         
         # Display or save report
         if save_report:
-            with open(save_report, 'w', encoding='utf-8') as f:
-                if format == "json":
-                    f.write(report)
-                else:
-                    f.write(report)
+            Path(save_report).write_text(report, encoding="utf-8")
             console.print(f"[green]📄 Audit report saved to: {save_report}[/green]")
         else:
             if format == "text":
@@ -624,9 +629,12 @@ def audit_pattern(
         
         # Summary statistics
         if findings:
-            error_count = sum(1 for f in findings if f.severity in [AuditSeverity.ERROR, AuditSeverity.CRITICAL])
-            warning_count = sum(1 for f in findings if f.severity == AuditSeverity.WARNING)
-            info_count = sum(1 for f in findings if f.severity == AuditSeverity.INFO)
+            from loom.auditor import AuditSeverity
+
+            counts = Counter(f.severity for f in findings)
+            error_count = counts[AuditSeverity.ERROR] + counts[AuditSeverity.CRITICAL]
+            warning_count = counts[AuditSeverity.WARNING]
+            info_count = counts[AuditSeverity.INFO]
             
             console.print("\n[bold]📊 Audit Summary:[/bold]")
             console.print(f"  • [red]Errors/Critical: {error_count}[/red]")
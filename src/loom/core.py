@@ -10,7 +10,7 @@ Core data models for Loom
 """
 from dataclasses import dataclass, field  # Add this line
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple, ClassVar
 
 
 class CapabilityType(str, Enum):
@@ -91,13 +91,22 @@ class CapabilityType(str, Enum):
     def _missing_(cls, value):
         """Handle case-insensitive lookup"""
         if isinstance(value, str):
-            for member in cls:
-                if member.value == value.lower():
-                    return member
+            return _CAPABILITY_BY_VALUE.get(value.casefold())
         return None
 
+
+# Lowercase value -> member, used by CapabilityType._missing_
+_CAPABILITY_BY_VALUE = {member.value: member for member in CapabilityType}
+
+# OSSProject fields that feed the cached score vector
+_SCORE_FIELDS = frozenset({'security_score', 'cost_score', 'complexity_score', 'maturity_score', 'license_risk_score'})
+
+
+def _score_or_default(score: Optional[float]) -> float:
+    """Missing (None) scores fall back to the 0.5 field default."""
+    return 0.5 if score is None else score
      
-@dataclass
+@dataclass(slots=True)
 class OSSProject:
     """Open Source Software Project"""
     name: str
@@ -114,11 +123,83 @@ class OSSProject:
     complexity_score: float = 0.5
     maturity_score: float = 0.5
     license_risk_score: float = 0.5
+    # (capabilities snapshot, member set, values), rebuilt by _capability_cache when
+    # the capabilities list no longer matches the snapshot
+    _capabilities_cache: Tuple[Tuple[Any, ...], FrozenSet[CapabilityType], Tuple[str, ...]] = field(
+        default=((), frozenset(), ()), init=False, repr=False, compare=False
+    )
+    # Scoring terms, higher is better: (security, 1-cost, 1-complexity, maturity, 1-license_risk).
+    # Built lazily by score_vec() and reset by __setattr__ whenever a score field is assigned.
+    _score_vec: Optional[Tuple[float, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # Bumped whenever a score of an existing project is reassigned, so results derived
+    # from scores elsewhere (e.g. Pattern.calculate_metrics) can tell they are stale
+    _score_edits: ClassVar[int] = 0
     
     def __post_init__(self):
         # Convert string capabilities to enum
-        if self.capabilities and isinstance(self.capabilities[0], str):
-            self.capabilities = [CapabilityType(c) for c in self.capabilities]
+        cap_type = CapabilityType
+        self.capabilities = [c if isinstance(c, cap_type) else cap_type(c) for c in self.capabilities]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _SCORE_FIELDS:
+            try:
+                self._score_vec
+            except AttributeError:
+                return  # Still in __init__, which sets _score_vec after the scores
+            object.__setattr__(self, '_score_vec', None)
+            OSSProject._score_edits += 1
+
+    def score_vec(self) -> Tuple[float, ...]:
+        """Get the scoring terms (security, 1-cost, 1-complexity, maturity, 1-license_risk)."""
+        vec = self._score_vec
+        if vec is None:
+            vec = (
+                _score_or_default(self.security_score),
+                1 - _score_or_default(self.cost_score),
+                1 - _score_or_default(self.complexity_score),
+                _score_or_default(self.maturity_score),
+                1 - _score_or_default(self.license_risk_score),
+            )
+            self._score_vec = vec
+        return vec
+
+    def _capability_cache(self) -> Tuple[Tuple[Any, ...], FrozenSet[CapabilityType], Tuple[str, ...]]:
+        """Get the capability cache, rebuilding it if the capabilities list was edited."""
+        cache = self._capabilities_cache
+        snapshot = tuple(self.capabilities)
+        if cache[0] != snapshot:
+            members = tuple(CapabilityType(c) for c in snapshot)
+            cache = (snapshot, frozenset(members), tuple(c.value for c in members))
+            self._capabilities_cache = cache
+        return cache
+
+    def capability_set(self) -> FrozenSet[CapabilityType]:
+        """Get the capabilities as a frozenset, for O(1) membership checks."""
+        return self._capability_cache()[1]
+
+    def capability_values(self) -> Tuple[str, ...]:
+        """Get the capability values, in list order."""
+        return self._capability_cache()[2]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable fields only (capabilities as values, no caches)."""
+        return {
+            'name': self.name,
+            'description': self.description,
+            # Read from the live list so in-place edits are saved
+            'capabilities': [CapabilityType(c).value for c in self.capabilities],
+            'github_url': self.github_url,
+            'license': self.license,
+            'security_score': self.security_score,
+            'popularity_score': self.popularity_score,
+            'compatibility_tags': self.compatibility_tags,
+            'metadata': self.metadata,
+            'cost_score': self.cost_score,
+            'complexity_score': self.complexity_score,
+            'maturity_score': self.maturity_score,
+            'license_risk_score': self.license_risk_score,
+        }
 
 class RelationshipType(str, Enum):
     """Types of relationships between OSS projects."""
@@ -130,13 +211,19 @@ class RelationshipType(str, Enum):
     EXTENDS = "extends"
 
 
-class Relationship(BaseModel):
+@dataclass(slots=True)
+class Relationship:
     """Relationship between two OSS projects."""
-    source: str = Field(..., description="Source project name")
-    target: str = Field(..., description="Target project name")
-    relationship_type: RelationshipType = Field(..., description="Type of relationship")
-    strength: float = Field(1.0, description="Strength of relationship (0-1)")
-    evidence: Optional[str] = Field(None, description="Evidence for this relationship")
+    source: str  # Source project name
+    target: str  # Target project name
+    relationship_type: RelationshipType
+    strength: float = 1.0  # Strength of relationship (0-1)
+    evidence: Optional[str] = None  # Evidence for this relationship
+    
+    def __post_init__(self):
+        # Accept plain strings for the relationship type
+        if not isinstance(self.relationship_type, RelationshipType):
+            self.relationship_type = RelationshipType(self.relationship_type)
 
 
 class Intent(BaseModel):
@@ -3,16 +3,49 @@ Semantic Graph - The 'Yarn Barn' of Loom.
 Stores knowledge about OSS projects and their relationships.
 """
 import networkx as nx
+import hashlib
 import json
 import logging
-import pickle
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
-from .core import OSSProject, Relationship, RelationshipType, CapabilityType
+from typing import List, Dict, Any, Optional, Set, Iterator, Tuple, FrozenSet, KeysView
+from .core import OSSProject, Relationship, RelationshipType, CapabilityType, _CAPABILITY_BY_VALUE
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
 
 # Add this line
 logger = logging.getLogger(__name__)
 
+_NGRAM = 3  # Character n-gram size used by the search index
+_EDGES_AMONG_CACHE_SIZE = 512  # Name sets kept by edges_among() per graph version
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON doesn't handle natively (enums by value)."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _capability_key(capability: Any) -> Optional[CapabilityType]:
+    """Resolve a capability, its value or its member name without raising."""
+    if isinstance(capability, CapabilityType):
+        return capability
+    text = str(capability)
+    return _CAPABILITY_BY_VALUE.get(text.casefold()) or CapabilityType.__members__.get(text.upper())
+
+
+def _ngrams(text: str) -> Set[str]:
+    """Character trigrams of text (callers pass it lowercased)."""
+    return {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
 class SemanticGraph:
     """Knowledge graph of OSS projects and their capabilities."""
     
@@ -25,46 +58,87 @@ class SemanticGraph:
         
         self.graph = nx.DiGraph()
         self.projects: Dict[str, OSSProject] = {}
+        self._dirty = False  # Unsaved changes pending flush()
+        self.version = 0  # Bumped on every mutation so callers can cache derived data
+        # Name set -> edges among those projects, valid for _edges_among_version
+        self._edges_among_cache: Dict[FrozenSet[str], Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._edges_among_version = -1
+        self._last_hash: Optional[bytes] = None  # Digest of the last payload written
+        # Capability -> project names, as insertion-ordered dict keys
+        self._cap_index: Dict[CapabilityType, Dict[str, None]] = defaultdict(dict)
+        # Project name -> capabilities it is indexed under (the project may have been edited since)
+        self._indexed_caps: Dict[str, FrozenSet[CapabilityType]] = {}
+        # Capability -> projects by popularity, rebuilt lazily after changes
+        self._cap_by_popularity: Dict[CapabilityType, List[OSSProject]] = {}
+        # Lowercased name -> canonical project name (first added wins)
+        self._projects_ci: Dict[str, str] = {}
+        # Search index: trigram -> project names, plus each project's trigrams
+        self._ngram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._project_ngrams: Dict[str, frozenset] = {}
+        # Lowercased (name, description, capability values) per project
+        self._search_fields: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self._positions: Dict[str, int] = {}  # Insertion order, for stable results
+        # Outgoing edges by source -> relationship type value -> targets
+        self._adj: Dict[str, Dict[str, Dict[str, None]]] = defaultdict(lambda: defaultdict(dict))
         
         # Try to load existing data
         self._load()
         
+    def flush(self) -> None:
+        """Save the graph if it has unsaved changes."""
+        if self._dirty:
+            self._save()
+    
+    @contextmanager
+    def batch(self) -> Iterator["SemanticGraph"]:
+        """
+        Group several mutations and save once on exit.
+        
+        The save also runs when the block raises, so the file always matches the
+        in-memory graph, including the mutations applied before the error.
+        """
+        try:
+            yield self
+        finally:
+            self.flush()
+        
     def _save(self) -> None:
         """Save graph to JSON file"""
-        data = {}
-        for name, project in self.projects.items():
-            # Convert project to dict using __dict__
-            if hasattr(project, '__dict__'):
-                project_dict = project.__dict__.copy()
-                # Convert capabilities to strings
-                if 'capabilities' in project_dict:
-                    project_dict['capabilities'] = [
-                        c.value if hasattr(c, 'value') else c 
-                        for c in project_dict['capabilities']
-                    ]
-                data[name] = project_dict
-            else:
-                data[name] = project
-        
-        # Ensure directory exists
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        data = {name: project.to_dict() for name, project in self.projects.items()}
         
         file_path = self.data_dir / "projects.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson:
+            payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, default=_json_default).encode('utf-8')
         
-        logger.info(f"💾 Saved {len(self.projects)} projects to {file_path}")       
+        # Skip the write when nothing changed since the last save
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._last_hash and file_path.exists():
+            self._dirty = False
+            return
+        
+        # Write to a temp file and swap it in, so a crash never leaves a partial file
+        tmp_path = file_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+        self._last_hash = digest
+        self._dirty = False
+        
+        logger.debug("Saved %d projects to %s", len(self.projects), file_path)
 
     def _load(self) -> None:
         """Load projects from JSON file"""
         projects_file = self.data_dir / "projects.json"
         if not projects_file.exists():
-            logger.warning(f"Projects file not found: {projects_file}")
+            logger.warning("Projects file not found: %s", projects_file)
             return
 
         try:
             with open(projects_file, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             # Handle both dictionary (old) and list (new) formats
             if isinstance(data, dict):
@@ -77,7 +151,7 @@ class SemanticGraph:
                         project = OSSProject(**proj_data)
                         self.add_project(project)
                     except Exception as e:
-                        logger.error(f"Error loading project {name}: {e}")
+                        logger.error("Error loading project %s: %s", name, e)
             elif isinstance(data, list):
                 # New format: [{...}, {...}]
                 for proj_data in data:
@@ -86,22 +160,71 @@ class SemanticGraph:
                             project = OSSProject(**proj_data)
                             self.add_project(project)
                         else:
-                            logger.warning(f"Skipping non-dict project data: {type(proj_data)}")
+                            logger.warning("Skipping non-dict project data: %s", type(proj_data))
                     except Exception as e:
-                        logger.error(f"Error loading project: {e}")
+                        logger.error("Error loading project: %s", e)
             else:
-                logger.error(f"Unexpected data format: {type(data)}")
+                logger.error("Unexpected data format: %s", type(data))
                 
-            logger.info(f"📂 Loaded {len(self.projects)} projects from {projects_file}")
+            # Freshly loaded data matches what is on disk
+            self._dirty = False
+            logger.debug("Loaded %d projects from %s", len(self.projects), projects_file)
             
         except Exception as e:
-            logger.error(f"Failed to load projects: {e}")
+            logger.error("Failed to load projects: %s", e)
     
     def add_project(self, project: OSSProject) -> None:
-        """Add a project to the graph."""
+        """Add a project to the graph (call flush() to persist)."""
+        capabilities = project.capability_set()
+        previous_caps = self._indexed_caps.get(project.name)
+        if previous_caps is not None:
+            self._unindex_project(project.name, previous_caps - capabilities)
+            for cap in previous_caps:
+                self._cap_by_popularity.pop(cap, None)
         self.projects[project.name] = project
-        self._save()
-        logger.info(f"✅ Added project: {project.name}")
+        self._indexed_caps[project.name] = capabilities
+        self._projects_ci.setdefault(project.name.lower(), project.name)
+        for cap in capabilities:
+            self._cap_index[cap][project.name] = None
+            self._cap_by_popularity.pop(cap, None)
+        self._index_search_terms(project)
+        self._dirty = True
+        self.version += 1
+        logger.debug("Added project: %s", project.name)
+    
+    def _unindex_project(self, name: str, capabilities: FrozenSet[CapabilityType]) -> None:
+        """Remove a project name from the capability index under the given capabilities."""
+        for cap in capabilities:
+            names = self._cap_index.get(cap)
+            if names is not None:
+                names.pop(name, None)
+                if not names:
+                    del self._cap_index[cap]
+
+    def _index_search_terms(self, project: OSSProject) -> None:
+        """Update the search fields and trigram index for a (possibly replaced) project."""
+        name = project.name
+        name_lc = name.lower()
+        desc_lc = project.description.lower() if project.description else ""
+        cap_values_lc = tuple(value.lower() for value in project.capability_values())
+        self._search_fields[name] = (name_lc, desc_lc, cap_values_lc)
+
+        grams = _ngrams(name_lc) | _ngrams(desc_lc)
+        for value in cap_values_lc:
+            grams |= _ngrams(value)
+        grams = frozenset(grams)
+
+        previous = self._project_ngrams.get(name, frozenset())
+        for gram in previous - grams:
+            names = self._ngram_index.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._ngram_index[gram]
+        for gram in grams - previous:
+            self._ngram_index[gram].add(name)
+        self._project_ngrams[name] = grams
+        self._positions.setdefault(name, len(self._positions))
 
     def get_project(self, name: str) -> Optional[OSSProject]:
         """Get a project by name (case-insensitive)"""
@@ -110,78 +233,95 @@ class SemanticGraph:
             return self.projects[name]
         
         # Case-insensitive match
-        name_lower = name.lower()
-        for proj_name, project in self.projects.items():
-            if proj_name.lower() == name_lower:
-                return project
-        
-        return None     
+        canonical = self._projects_ci.get(name.lower())
+        return self.projects.get(canonical) if canonical is not None else None
        
     def add_relationship(self, relationship: Relationship) -> None:
-        """Add a relationship between two projects."""
+        """Add a relationship between two projects (call flush() to persist)."""
         if relationship.source not in self.projects:
-            print(f"⚠️  Warning: Source project {relationship.source} not found")
+            logger.warning("Source project %s not found", relationship.source)
             return
         if relationship.target not in self.projects:
-            print(f"⚠️  Warning: Target project {relationship.target} not found")
+            logger.warning("Target project %s not found", relationship.target)
             return
             
+        rel_type = relationship.relationship_type.value
+        existing = self.graph.get_edge_data(relationship.source, relationship.target)
+        if existing is not None:
+            # Re-adding an edge replaces its type, as in the DiGraph
+            self._adj[relationship.source][existing["relationship_type"]].pop(relationship.target, None)
+        self._adj[relationship.source][rel_type][relationship.target] = None
         self.graph.add_edge(
             relationship.source,
             relationship.target,
-            relationship_type=relationship.relationship_type.value,
+            relationship_type=rel_type,
             strength=relationship.strength,
             evidence=relationship.evidence
         )
-        self._save()
-        print(f"🔗 Added relationship: {relationship.source} -> {relationship.target}")
+        self._dirty = True
+        self.version += 1
+        logger.debug("Added relationship: %s -> %s", relationship.source, relationship.target)
         
     def find_by_capability(self, capability: CapabilityType) -> List[str]:
-        """Find projects that provide a specific capability."""
-        matching_projects = []
-        for name, project in self.projects.items():
-            if capability in project.capabilities:
-                matching_projects.append(name)
-        return matching_projects
+        """Find projects that provide a specific capability (enum, value or name)."""
+        return list(self._cap_index.get(_capability_key(capability), ()))
+    
+    def projects_by_capability(self, capability: CapabilityType) -> List[OSSProject]:
+        """Projects that provide a capability, most popular first (shared list, do not modify)."""
+        projects = self._cap_by_popularity.get(capability)
+        if projects is None:
+            projects = [self.projects[name] for name in self._cap_index.get(capability, ())]
+            projects.sort(key=lambda p: p.popularity_score, reverse=True)
+            self._cap_by_popularity[capability] = projects
+        return projects
         
+    def edges_among(self, names: FrozenSet[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Edges between distinct projects in names, as source -> target -> edge data (cached)."""
+        if self._edges_among_version != self.version:
+            self._edges_among_cache.clear()
+            self._edges_among_version = self.version
+        edges = self._edges_among_cache.get(names)
+        if edges is None:
+            edges = {}
+            successors = self.graph.succ
+            for source in names:
+                if source not in successors:
+                    continue
+                linked = {
+                    target: data for target, data in successors[source].items()
+                    if target in names and target != source
+                }
+                if linked:
+                    edges[source] = linked
+            if len(self._edges_among_cache) >= _EDGES_AMONG_CACHE_SIZE:
+                self._edges_among_cache.clear()
+            self._edges_among_cache[names] = edges
+        return edges
+    
     def get_compatible_projects(self, project_name: str) -> List[str]:
         """Get projects that are compatible with a given project."""
-        if project_name not in self.graph:
-            return []
-            
-        compatible = []
-        for _, target, data in self.graph.edges(project_name, data=True):
-            if data.get("relationship_type") == RelationshipType.COMPATIBLE_WITH.value:
-                compatible.append(target)
-        return compatible
+        return self._targets(project_name, RelationshipType.COMPATIBLE_WITH)
         
     def find_alternatives(self, project_name: str) -> List[str]:
         """Find alternative projects to a given project."""
-        if project_name not in self.graph:
+        return self._targets(project_name, RelationshipType.ALTERNATIVE_TO)
+
+    def _targets(self, project_name: str, relationship_type: RelationshipType) -> List[str]:
+        """Targets of a project's outgoing edges of one relationship type."""
+        by_type = self._adj.get(project_name)
+        if by_type is None:
             return []
-            
-        alternatives = []
-        for _, target, data in self.graph.edges(project_name, data=True):
-            if data.get("relationship_type") == RelationshipType.ALTERNATIVE_TO.value:
-                alternatives.append(target)
-        return alternatives
+        return list(by_type.get(relationship_type.value, ()))
  
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the graph."""
         stats = {
-            'projects': len(self.projects),
-            'capability_coverage': 0,
-            'nodes': len(self.projects),
+            'projects': len(self),
+            'capability_coverage': len(self._cap_index),  # Unique capabilities
+            'nodes': len(self),
             'edges': 0  # We don't track edges in current implementation
         }
         
-        # Count unique capabilities
-        all_caps = set()
-        for project in self.projects.values():
-            for cap in project.capabilities:
-                all_caps.add(cap.value)
-        stats['capability_coverage'] = len(all_caps)
-        
         return stats   
       
     def search(self, query: str) -> List[tuple[OSSProject, float]]:
@@ -194,25 +334,37 @@ class SemanticGraph:
         results = []
         query = query.lower()
         
-        for project in self.projects.values():
+        if len(query) >= _NGRAM:
+            # Only projects containing every trigram of the query can match
+            postings = sorted(
+                (self._ngram_index.get(gram, set()) for gram in _ngrams(query)), key=len
+            )
+            candidates = postings[0].intersection(*postings[1:])
+            pool = sorted(candidates, key=self._positions.__getitem__)
+        else:
+            pool = self.projects
+        
+        search_fields = self._search_fields
+        for name in pool:
+            name_lc, desc_lc, cap_values_lc = search_fields[name]
             score = 0.0
             
             # Name match (highest weight)
-            if query in project.name.lower():
+            if query in name_lc:
                 score += 0.5
             
             # Description match
-            if project.description and query in project.description.lower():
+            if desc_lc and query in desc_lc:
                 score += 0.3
             
             # Capabilities match
-            for cap in project.capabilities:
-                if query in cap.value.lower():
+            for value in cap_values_lc:
+                if query in value:
                     score += 0.2
                     break
             
             if score > 0:
-                results.append((project, score))
+                results.append((self.projects[name], score))
         
         # Sort by score descending
         results.sort(key=lambda x: x[1], reverse=True)
@@ -222,13 +374,32 @@ class SemanticGraph:
         """Clear all data from the graph."""
         self.graph = nx.DiGraph()
         self.projects = {}
+        self._cap_index = defaultdict(dict)
+        self._indexed_caps = {}
+        self._cap_by_popularity = {}
+        self._projects_ci = {}
+        self._ngram_index = defaultdict(set)
+        self._project_ngrams = {}
+        self._search_fields = {}
+        self._positions = {}
+        self._adj = defaultdict(lambda: defaultdict(dict))
+        self._dirty = False
+        self._last_hash = None
+        self.version += 1
         if self.graph_file.exists():
             self.graph_file.unlink()
         if self.projects_file.exists():
             self.projects_file.unlink()
-        print("🧹 Graph cleared!")
+        logger.info("Graph cleared")
 
     def get_all_projects(self) -> List[OSSProject]:
         """Get all projects in the graph."""
         return list(self.projects.values())
 
+    def project_names(self) -> KeysView[str]:
+        """Get a live view of project names without copying the catalog."""
+        return self.projects.keys()
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
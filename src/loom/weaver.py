@@ -1,10 +1,134 @@
 ﻿"""
 Pattern Weaver - The intelligent engine that finds architectural patterns.
 """
-from typing import List, Dict, Any, Optional, Tuple
+import heapq
+import re
+import struct
+import weakref
+from collections import namedtuple, OrderedDict
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet, Iterator
 from .core import Intent, CapabilityType, OSSProject, RelationshipType
 from .graph import SemanticGraph
 
+
+def _keyword_re(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into one alternation (plain substring matching, no word boundaries)."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Domain detection in weave_for_intent, checked in this order
+_CMS_RE = _keyword_re(('cms', 'content management', 'content publishing', 'blog', 'article'))
+_ECOMMERCE_RE = _keyword_re(('e-commerce', 'ecommerce', 'shop', 'store', 'cart', 'checkout'))
+_ANALYTICS_RE = _keyword_re(('analytics', 'dashboard', 'metrics', 'reporting', 'visualization'))
+
+# Pattern templates for PatternWeaver._generate_from_template. Each slot is
+# (capability, role, preferred project names, fall back to most popular, required);
+# the pattern is skipped when a required slot cannot be filled.
+_CMS_TEMPLATE = {
+    "name": "Modern Content Management System",
+    "description": "Complete CMS with authentication, media storage, and search",
+    "tags": ("cms", "content", "publishing", "media"),
+    "slots": (
+        (CapabilityType.WEB_FRAMEWORK, "CMS Framework", ("Django", "FastAPI"), True, True),
+        (CapabilityType.DATABASE, "Content Database", ("PostgreSQL",), True, True),
+        (CapabilityType.AUTHENTICATION, "Authentication & User Management", (), True, False),
+        (CapabilityType.STORAGE, "Media & File Storage", (), True, False),
+        (CapabilityType.SEARCH, "Content Search Engine", (), True, False),
+        (CapabilityType.CACHE, "Content Cache", ("Redis",), False, False),
+    ),
+}
+_ECOMMERCE_TEMPLATE = {
+    "name": "E-commerce Platform",
+    "description": "Scalable online store with inventory, cart, orders, and payments",
+    "tags": ("ecommerce", "store", "retail", "payments"),
+    "slots": (
+        (CapabilityType.WEB_FRAMEWORK, "Store Frontend & API", (), True, True),
+        (CapabilityType.DATABASE, "Product & Order Database", (), True, True),
+        (CapabilityType.CACHE, "Session & Catalog Cache", (), True, False),
+        (CapabilityType.MESSAGE_QUEUE, "Order Processing Queue", (), True, False),
+        (CapabilityType.MONITORING, "Store Analytics", (), True, False),
+    ),
+}
+_ANALYTICS_TEMPLATE = {
+    "name": "Real-time Analytics Dashboard",
+    "description": "Data processing pipeline with visualization and monitoring",
+    "tags": ("analytics", "dashboard", "metrics", "visualization"),
+    "slots": (
+        (CapabilityType.MESSAGE_QUEUE, "Data Ingestion Pipeline", ("Kafka",), False, False),
+        (CapabilityType.DATABASE, "Analytics Data Store", ("MongoDB",), True, False),
+        (CapabilityType.MONITORING, "Dashboard & Visualization", ("Grafana",), False, False),
+    ),
+}
+_FULL_STACK_TEMPLATE = {
+    "name": "Full Stack Python API",
+    "description": "Production-ready web API with PostgreSQL database",
+    "tags": ("production", "python", "api", "database"),
+    "slots": (
+        (CapabilityType.WEB_FRAMEWORK, "API Framework", ("FastAPI",), False, True),
+        (CapabilityType.DATABASE, "Primary Database", ("PostgreSQL",), False, True),
+        (CapabilityType.CACHE, "Cache & Session Store", ("Redis",), False, False),
+        (CapabilityType.DATABASE, "ORM & Data Layer", ("SQLAlchemy",), False, False),
+    ),
+}
+
+# Component roles for the Minimal Viable Architecture pattern
+_MINIMAL_ROLES = {
+    CapabilityType.WEB_FRAMEWORK: "Application Framework",
+    CapabilityType.DATABASE: "Data Storage",
+    CapabilityType.CACHE: "Cache Layer",
+    CapabilityType.MESSAGE_QUEUE: "Message Queue",
+    CapabilityType.AI_MODEL: "AI/ML Framework",
+    CapabilityType.AUTHENTICATION: "Authentication",
+    CapabilityType.STORAGE: "File Storage",
+    CapabilityType.MONITORING: "Monitoring",
+    CapabilityType.SEARCH: "Search Engine",
+    CapabilityType.LOAD_BALANCER: "Load Balancer",
+    CapabilityType.EMAIL: "Email Service",
+    CapabilityType.OBJECT_STORAGE: "Object Storage",
+    CapabilityType.PAYMENT: "Payment Processor",
+    CapabilityType.CDN: "CDN",
+}
+
+
+# Default objective weights, used for any weight not provided
+DEFAULT_WEIGHTS = {
+    'security': 0.4,
+    'cost': 0.15,
+    'complexity': 0.15,
+    'maturity': 0.2,
+    'license_risk': 0.1
+}
+
+
+def _weight_vec(weights: Optional[Dict[str, float]]) -> Tuple[float, ...]:
+    """Merge weights over the defaults, normalize to sum to 1.0, and order them like OSSProject.score_vec()."""
+    w = DEFAULT_WEIGHTS.copy()
+    if weights:
+        w.update(weights)
+    
+    total = sum(w.values())
+    if total > 0:
+        w = {k: v/total for k, v in w.items()}
+    
+    return (w['security'], w['cost'], w['complexity'], w['maturity'], w['license_risk'])
+
+
+_DEFAULT_WEIGHT_VEC = _weight_vec(None)
+_WEIGHT_KEY = struct.Struct('5d')  # Packs a weight vector into a bytes memo key
+
+
+def _score_vec(comp: Any) -> Tuple[float, ...]:
+    """Scoring terms for a component without OSSProject.score_vec()."""
+    return (
+        getattr(comp, 'security_score', 0.5),
+        1 - getattr(comp, 'cost_score', 0.5),
+        1 - getattr(comp, 'complexity_score', 0.5),
+        getattr(comp, 'maturity_score', 0.5),
+        1 - getattr(comp, 'license_risk_score', 0.5),
+    )
+
+
 def calculate_weighted_score(components: List[OSSProject], weights: Dict[str, float]) -> float:
     """
     Calculate weighted score based on multiple objectives
@@ -19,66 +143,115 @@ def calculate_weighted_score(components: List[OSSProject], weights: Dict[str, fl
     """
     if not components:
         return 0.0
-    
-    # Default weights if not provided
-    default_weights = {
-        'security': 0.4,
-        'cost': 0.15,
-        'complexity': 0.15,
-        'maturity': 0.2,
-        'license_risk': 0.1
-    }
-    
-    # Merge provided weights with defaults
-    w = default_weights.copy()
-    if weights:
-        w.update(weights)
-    
-    # Normalize weights to sum to 1.0
-    total = sum(w.values())
-    if total > 0:
-        w = {k: v/total for k, v in w.items()}
-    
+    return _weighted_score(components, _weight_vec(weights) if weights else _DEFAULT_WEIGHT_VEC)
+
+
+def _weighted_score(components: List[OSSProject], weight_vec: Tuple[float, ...]) -> float:
+    """Average weighted score of non-empty components for normalized weights from _weight_vec."""
+    w_security, w_cost, w_complexity, w_maturity, w_license = weight_vec
     total_score = 0.0
     
     for comp in components:
-        comp_score = 0.0
-        
-        # Security (higher is better)
-        comp_score += w['security'] * getattr(comp, 'security_score', 0.5)
-        
-        # Cost (lower is better, so invert)
-        comp_score += w['cost'] * (1 - getattr(comp, 'cost_score', 0.5))
-        
-        # Complexity (lower is better, so invert)
-        comp_score += w['complexity'] * (1 - getattr(comp, 'complexity_score', 0.5))
-        
-        # Maturity (higher is better)
-        comp_score += w['maturity'] * getattr(comp, 'maturity_score', 0.5)
-        
-        # License risk (lower is better, so invert)
-        comp_score += w['license_risk'] * (1 - getattr(comp, 'license_risk_score', 0.5))
-        
-        total_score += comp_score
+        # Cached on OSSProject; other component objects get the 0.5 defaults
+        scores = getattr(comp, 'score_vec', None)
+        security, cost, complexity, maturity, license_risk = scores() if scores is not None else _score_vec(comp)
+        total_score += (
+            w_security * security          # Security (higher is better)
+            + w_cost * cost                # Cost (lower is better, so inverted)
+            + w_complexity * complexity    # Complexity (lower is better, so inverted)
+            + w_maturity * maturity        # Maturity (higher is better)
+            + w_license * license_risk     # License risk (lower is better, so inverted)
+        )
     
     return total_score / len(components)  # Average across components
 
+
+# Read-only snapshot of a scored pattern for in-process consumers
+PatternView = namedtuple('PatternView', 'name description components confidence complexity')
+
+
 class Pattern:
-    """A discovered architectural pattern."""
+    """
+    A discovered architectural pattern.
+    
+    components is a read-only tuple of (project, role); change it through
+    add_component and remove_component so the cached per-component state follows.
+    """
+    
+    __slots__ = (
+        'name', 'description', 'intent', '_components', '_projects', '_names',
+        'connections', 'complexity', 'confidence', 'tags', 'transformation_notes',
+        '_name_to_index', '_revision',
+        '_connections_key', '_metrics_key', '_metrics', '_view',
+    )
     
     def __init__(self, name: str, description: str, intent: Intent = None):        
         self.name = name
         self.description = description
         self.intent = intent  # ⬅️⬅️⬅️ CRITICAL: ADD THIS LINE
-        self.components: List[Tuple[OSSProject, str]] = []  # (project, role)
+        self._components: Tuple[Tuple[OSSProject, str], ...] = ()  # (project, role)
+        # Parallel per-component columns for the metric and connection passes
+        self._projects: List[OSSProject] = []
+        self._names: List[str] = []
         self.connections: List[Dict[str, Any]] = []
         self.complexity: float = 0.0  # 0-1 scale
         self.confidence: float = 0.0  # 0-1 scale
         self.tags: List[str] = []
+        self.transformation_notes: List[str] = []
+        self._name_to_index: Dict[str, int] = {}  # first index of each project name
+        self._revision = 0  # Bumped by add_component/remove_component
+        # (graph, graph version, revision) the cached connections were built for
+        self._connections_key: Optional[Tuple[SemanticGraph, int, int]] = None
+        # (revision, packed weights, security boost, score edits) -> (confidence, complexity)
+        # of the last calculate_metrics
+        self._metrics_key: Optional[Tuple[int, bytes, bool, int]] = None
+        self._metrics: Tuple[float, float] = (0.0, 0.0)
+        self._view: Optional[Tuple[Tuple, PatternView]] = None  # (key, view) of the last to_view
+        
+    @property
+    def components(self) -> Tuple[Tuple[OSSProject, str], ...]:
+        """The (project, role) components, in the order they were added."""
+        return self._components
         
     def add_component(self, project: OSSProject, role: str):
         """Add a component to the pattern."""
-        self.components.append((project, role))
+        self._name_to_index.setdefault(project.name, len(self._components))
+        self._components += ((project, role),)
+        self._projects.append(project)
+        self._names.append(project.name)
+        self._revision += 1
+        
+    def has_component(self, name: str) -> bool:
+        """Check if the pattern has a component with the given project name."""
+        return name in self._name_to_index
+        
+    def remove_component(self, name: str) -> bool:
+        """Remove the first component with the given project name."""
+        index = self._name_to_index.get(name)
+        if index is None:
+            return False
+        self._components = self._components[:index] + self._components[index + 1:]
+        del self._projects[index]
+        del self._names[index]
+        # Rebuild the index so component order is preserved
+        self._name_to_index = {}
+        for i, project in enumerate(self._projects):
+            self._name_to_index.setdefault(project.name, i)
+        self._revision += 1
+        return True
+        
+    def average_security_score(self) -> float:
+        """Get the average security score across components."""
+        projects = self._projects
+        if not projects:
+            return 0.0
+        # Read live: project scores can be reassigned after the component was added
+        return sum(project.score_vec()[0] for project in projects) / len(projects)
+        
+    def capability_set(self) -> FrozenSet[CapabilityType]:
+        """Get the union of capabilities across all components."""
+        # Not cached: components' capabilities can be edited in place
+        return frozenset().union(*(project.capability_set() for project in self._projects))
         
    
     def calculate_metrics(self, weights: Optional[Dict[str, float]] = None) -> None:
@@ -93,54 +266,90 @@ class Pattern:
             self.complexity = 0.0
             return
         
+        # Reuse the last result when components, normalized weights, the intent's
+        # HIGH_SECURITY requirement and all project scores are unchanged
+        weight_vec = _weight_vec(weights) if weights else _DEFAULT_WEIGHT_VEC
+        security_boost = bool(self.intent and CapabilityType.HIGH_SECURITY in self.intent.required_capabilities)
+        key = (self._revision, _WEIGHT_KEY.pack(*weight_vec), security_boost, OSSProject._score_edits)
+        if self._metrics_key == key:
+            self.confidence, self.complexity = self._metrics
+            return
+        
+        projects = self._projects
+        count = len(projects)
+        
         # Calculate weighted score using multi-objective function
-        # Make sure we're passing the weights dict, not the graph
-        self.confidence = calculate_weighted_score([c[0] for c in self.components], weights or {})
+        self.confidence = _weighted_score(projects, weight_vec)
         
         # Complexity: average of component complexities (inverted from simplicity)
-        complexities = []
-        for comp, _ in self.components:
-            # Use complexity_score if available, otherwise default to 0.5
-            comp_complexity = getattr(comp, 'complexity_score', 0.5)
-            complexities.append(comp_complexity)
-        
-        self.complexity = sum(complexities) / len(complexities)
+        self.complexity = sum(comp.complexity_score for comp in projects) / count
         
         # Security boost for HIGH_SECURITY intent (legacy support)
-        if self.intent and CapabilityType.HIGH_SECURITY in self.intent.required_capabilities:
-            avg_security = sum(getattr(comp, 'security_score', 0.5) for comp, _ in self.components) / len(self.components)
+        if security_boost:
+            avg_security = self.average_security_score()
             security_boost = avg_security * 0.2  # Up to 20% boost
-            self.confidence = min(1.0, self.confidence + security_boost)   
+            self.confidence = min(1.0, self.confidence + security_boost)
+        
+        self._metrics_key = key
+        self._metrics = (self.confidence, self.complexity)
                
+    def to_view(self, weights: Optional[Dict[str, float]] = None) -> PatternView:
+        """Get a scored PatternView, reused while nothing it holds has changed."""
+        self.calculate_metrics(weights)
+        key = (self._revision, self.name, self.description, self.confidence, self.complexity)
+        if self._view is not None and self._view[0] == key:
+            return self._view[1]
+        view = PatternView(self.name, self.description, self._components,
+                           self.confidence, self.complexity)
+        self._view = (key, view)
+        return view
+        
     def to_dict(self, graph: SemanticGraph, weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """Convert pattern to dictionary."""
-        self.calculate_metrics(weights)  # Pass weights, not graph
+        view = self.to_view(weights)  # Pass weights, not graph
         return {
-            "name": self.name,
-            "description": self.description,
+            "name": view.name,
+            "description": view.description,
             "components": [
                 {
                     "name": comp.name,
                     "role": role,
-                    "capabilities": [c.value for c in comp.capabilities],
-                    "popularity": getattr(comp, 'popularity_score', 0.5)
+                    "capabilities": list(comp.capability_values()),
+                    "popularity": comp.popularity_score
                 }
-                for comp, role in self.components
+                for comp, role in view.components
             ],
             "connections": self._get_connections(graph),
-            "confidence": self.confidence,
-            "complexity": self.complexity
+            "confidence": view.confidence,
+            "complexity": view.complexity
         }  
         
     def _get_connections(self, graph: SemanticGraph) -> List[Dict[str, Any]]:
-        """Get connections between components in this pattern."""
+        """Get connections between components in this pattern (cached until the pattern or graph changes)."""
+        key = (graph, graph.version, self._revision)  # SemanticGraph compares by identity
+        if self._connections_key == key:
+            return self.connections
+        
         connections = []
-        component_names = [comp[0].name for comp in self.components]
+        component_names = self._names
+        name_set = frozenset(component_names)
         
+        # Self-loops are not connections, so fewer than two distinct projects have none
+        if len(name_set) < 2:
+            self.connections = connections
+            self._connections_key = key
+            return connections
+        
+        # Shared with other patterns over the same projects
+        edges = graph.edges_among(name_set)
         for source_name in component_names:
+            linked = edges.get(source_name)
+            if not linked:
+                continue
+            # Emit in component order, as the pairwise scan did
             for target_name in component_names:
-                if source_name != target_name and graph.graph.has_edge(source_name, target_name):
-                    edge_data = graph.graph[source_name][target_name]
+                edge_data = linked.get(target_name)
+                if edge_data is not None:
                     connections.append({
                         "from": source_name,
                         "to": target_name,
@@ -149,12 +358,31 @@ class Pattern:
                         "evidence": edge_data.get('evidence', '')
                     })
         
+        self.connections = connections
+        self._connections_key = key
         return connections
 
 
+def _pattern_from_snapshot(snapshot: Tuple, intent: Intent) -> Pattern:
+    """Rebuild a fresh Pattern from a cached (name, description, components, tags) snapshot."""
+    name, description, components, tags = snapshot
+    pattern = Pattern(name=name, description=description, intent=intent)
+    for project, role in components:
+        pattern.add_component(project, role)
+    pattern.tags = list(tags)
+    return pattern
+
+
 class PatternWeaver:
     """Weaves patterns from intent and graph"""
     
+    # Graph -> (graph version, LRU of intent signature -> woven pattern snapshots),
+    # shared by every weaver on that graph
+    _pattern_cache: "weakref.WeakKeyDictionary[SemanticGraph, Tuple[int, OrderedDict]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _PATTERN_CACHE_SIZE = 128
+    
     def __init__(self, graph: SemanticGraph, intent: Optional[Intent] = None):
         """
         Initialize the PatternWeaver.
@@ -165,232 +393,131 @@ class PatternWeaver:
         """
         self.graph = graph
         self.intent = intent
-        self.patterns: List[Pattern] = []      
+        self.patterns: List[Pattern] = []
+        # Required capabilities -> (matching projects, per-capability name lookup),
+        # valid for graph version _matching_version
+        self._matching_cache: Dict[Tuple[CapabilityType, ...], Tuple[Dict, Dict]] = {}
+        self._matching_version: Optional[int] = None
+        self._by_name: Dict[CapabilityType, Dict[str, OSSProject]] = {}
  
     def weave_for_intent(self, intent: Intent) -> List[Pattern]:
         """Weave patterns based on user intent."""
         self.patterns = []
         
-        # Get all projects that match required capabilities
-        matching_projects = self._get_matching_projects(intent)
-        
-        if not matching_projects:
-            return self.patterns
-            
         # Check for domain-specific patterns based on intent description
         intent_lower = intent.description.lower()
         
         # CMS Pattern Detection
-        if any(keyword in intent_lower for keyword in ['cms', 'content management', 'content publishing', 'blog', 'article']):
-            self._generate_cms_pattern(intent, matching_projects)
+        if _CMS_RE.search(intent_lower):
+            domain_template = _CMS_TEMPLATE
         
         # E-commerce Pattern Detection  
-        elif any(keyword in intent_lower for keyword in ['e-commerce', 'ecommerce', 'shop', 'store', 'cart', 'checkout']):
-            self._generate_ecommerce_pattern(intent, matching_projects)
+        elif _ECOMMERCE_RE.search(intent_lower):
+            domain_template = _ECOMMERCE_TEMPLATE
         
         # Analytics Pattern Detection
-        elif any(keyword in intent_lower for keyword in ['analytics', 'dashboard', 'metrics', 'reporting', 'visualization']):
-            self._generate_analytics_pattern(intent, matching_projects)
+        elif _ANALYTICS_RE.search(intent_lower):
+            domain_template = _ANALYTICS_TEMPLATE
+        
+        else:
+            domain_template = None
+        
+        # The woven patterns depend only on the graph, the capabilities and the domain
+        signature = (tuple(intent.required_capabilities),
+                     domain_template["name"] if domain_template else None)
+        cache = self._cached_patterns()
+        snapshots = cache.get(signature)
+        if snapshots is not None:
+            cache.move_to_end(signature)
+            self.patterns = [_pattern_from_snapshot(snapshot, intent) for snapshot in snapshots]
+            return self.patterns
         
-        # Generic patterns if no domain detected or if we need more options
-        self._generate_capability_patterns(intent, matching_projects)
+        # Get all projects that match required capabilities
+        matching_projects = self._get_matching_projects(intent)
         
-        # Sort patterns by confidence (highest first)
-        self.patterns.sort(key=lambda p: p.confidence, reverse=True)
+        if matching_projects:
+            if domain_template is not None:
+                self._generate_from_template(domain_template, intent, matching_projects)
+            
+            # Generic patterns if no domain detected or if we need more options
+            self._generate_capability_patterns(intent, matching_projects)
+            
+            # Sort patterns by confidence (highest first)
+            self.patterns.sort(key=attrgetter('confidence'), reverse=True)
         
+        cache[signature] = tuple(
+            (p.name, p.description, tuple(p.components), tuple(p.tags)) for p in self.patterns
+        )
+        if len(cache) > self._PATTERN_CACHE_SIZE:
+            cache.popitem(last=False)
         return self.patterns
+    
+    def _cached_patterns(self) -> OrderedDict:
+        """Get the woven-pattern LRU for the current graph version."""
+        entry = self._pattern_cache.get(self.graph)
+        if entry is None or entry[0] != self.graph.version:
+            entry = (self.graph.version, OrderedDict())
+            self._pattern_cache[self.graph] = entry
+        return entry[1]
         
     def _get_matching_projects(self, intent: Intent) -> Dict[CapabilityType, List[OSSProject]]:
-        """Get projects matching each required capability."""
+        """Get projects matching each required capability (cached per graph version)."""
+        if self._matching_version != self.graph.version:
+            self._matching_cache.clear()
+            self._matching_version = self.graph.version
+        key = tuple(intent.required_capabilities)
+        cached = self._matching_cache.get(key)
+        if cached is not None:
+            matching, self._by_name = cached
+            return matching
+        
         matching = {}
         
         for capability in intent.required_capabilities:
-            project_names = self.graph.find_by_capability(capability)
-            projects = []
-            for name in project_names:
-                proj = self.graph.projects.get(name)
-                if proj:
-                    projects.append(proj)
-            
+            # Already sorted by popularity in the graph's capability index
+            projects = self.graph.projects_by_capability(capability)
             if projects:
-                # Sort by popularity
-                projects.sort(key=lambda p: p.popularity_score, reverse=True)
                 matching[capability] = projects
-                
+        
+        self._by_name = {cap: {p.name: p for p in projects} for cap, projects in matching.items()}
+        self._matching_cache[key] = (matching, self._by_name)
         return matching
     
-    def _generate_cms_pattern(self, intent: Intent, matching_projects: Dict[CapabilityType, List[OSSProject]]) -> None:
-        """Generate CMS-specific patterns."""
-        if (CapabilityType.WEB_FRAMEWORK in matching_projects and 
-            CapabilityType.DATABASE in matching_projects):
-            
-            web_projs = matching_projects[CapabilityType.WEB_FRAMEWORK]
-            db_projs = matching_projects[CapabilityType.DATABASE]
-            
-            # Try to find Django (best for CMS) or FastAPI
-            django = next((p for p in web_projs if p.name == "Django"), None)
-            fastapi = next((p for p in web_projs if p.name == "FastAPI"), None)
-            web_framework = django or fastapi or (web_projs[0] if web_projs else None)
-            
-            # Find PostgreSQL (best for CMS)
-            postgres = next((p for p in db_projs if p.name == "PostgreSQL"), None)
-            database = postgres or (db_projs[0] if db_projs else None)
-            
-            if web_framework and database:
-                # CMS Pattern 1: Full Featured CMS
-                pattern = Pattern(
-                    name="Modern Content Management System",
-                description="Complete CMS with authentication, media storage, and search",
-                intent=intent  # ADD THIS LINE
-            )           
-                
-                pattern.add_component(web_framework, "CMS Framework")
-                pattern.add_component(database, "Content Database")
-                
-                # Add authentication if available
-                if CapabilityType.AUTHENTICATION in matching_projects:
-                    auth_projs = matching_projects[CapabilityType.AUTHENTICATION]
-                    if auth_projs:
-                        pattern.add_component(auth_projs[0], "Authentication & User Management")
-                
-                # Add storage if available
-                if CapabilityType.STORAGE in matching_projects:
-                    storage_projs = matching_projects[CapabilityType.STORAGE]
-                    if storage_projs:
-                        pattern.add_component(storage_projs[0], "Media & File Storage")
-                
-                # Add search if available
-                if CapabilityType.SEARCH in matching_projects:
-                    search_projs = matching_projects[CapabilityType.SEARCH]
-                    if search_projs:
-                        pattern.add_component(search_projs[0], "Content Search Engine")
-                
-                # Add cache (important for CMS performance)
-                if CapabilityType.CACHE in matching_projects:
-                    cache_projs = matching_projects[CapabilityType.CACHE]
-                    redis = next((p for p in cache_projs if p.name == "Redis"), None)
-                    if redis:
-                        pattern.add_component(redis, "Content Cache")
-                
-                pattern.tags = ["cms", "content", "publishing", "media"]
-                self.patterns.append(pattern)
-    
-    def _generate_ecommerce_pattern(self, intent: Intent, matching_projects: Dict[CapabilityType, List[OSSProject]]) -> None:
-        """Generate e-commerce specific patterns."""
-        if (CapabilityType.WEB_FRAMEWORK in matching_projects and 
-            CapabilityType.DATABASE in matching_projects):
-            
-            # E-commerce needs: web framework, database, cache, message queue, monitoring
-            pattern = Pattern(
-                name="E-commerce Platform",
-                description="Scalable online store with inventory, cart, orders, and payments",
-                intent=intent
-            )
-            
-            # Add web framework
-            web_projs = matching_projects[CapabilityType.WEB_FRAMEWORK]
-            if web_projs:
-                pattern.add_component(web_projs[0], "Store Frontend & API")
-            
-            # Add database
-            db_projs = matching_projects[CapabilityType.DATABASE]
-            if db_projs:
-                pattern.add_component(db_projs[0], "Product & Order Database")
-            
-            # Add cache (for sessions and product catalog)
-            if CapabilityType.CACHE in matching_projects:
-                cache_projs = matching_projects[CapabilityType.CACHE]
-                if cache_projs:
-                    pattern.add_component(cache_projs[0], "Session & Catalog Cache")
-            
-            # Add message queue (for order processing)
-            if CapabilityType.MESSAGE_QUEUE in matching_projects:
-                mq_projs = matching_projects[CapabilityType.MESSAGE_QUEUE]
-                if mq_projs:
-                    pattern.add_component(mq_projs[0], "Order Processing Queue")
-            
-            # Add monitoring
-            if CapabilityType.MONITORING in matching_projects:
-                monitor_projs = matching_projects[CapabilityType.MONITORING]
-                if monitor_projs:
-                    pattern.add_component(monitor_projs[0], "Store Analytics")
-            
-            pattern.tags = ["ecommerce", "store", "retail", "payments"]
-            self.patterns.append(pattern)
-    
-    def _generate_analytics_pattern(self, intent: Intent, matching_projects: Dict[CapabilityType, List[OSSProject]]) -> None:
-        """Generate analytics/dashboard specific patterns."""
-        # Analytics Pattern
-        pattern = Pattern(
-            name="Real-time Analytics Dashboard",
-            description="Data processing pipeline with visualization and monitoring",
-            intent=intent
-        )
-        
-        # Add message queue for data ingestion
-        if CapabilityType.MESSAGE_QUEUE in matching_projects:
-            mq_projs = matching_projects[CapabilityType.MESSAGE_QUEUE]
-            kafka = next((p for p in mq_projs if p.name == "Kafka"), None)
-            if kafka:
-                pattern.add_component(kafka, "Data Ingestion Pipeline")
-        
-        # Add database
-        if CapabilityType.DATABASE in matching_projects:
-            db_projs = matching_projects[CapabilityType.DATABASE]
-            # Prefer MongoDB for analytics if available
-            mongodb = next((p for p in db_projs if p.name == "MongoDB"), None)
-            database = mongodb or (db_projs[0] if db_projs else None)
-            if database:
-                pattern.add_component(database, "Analytics Data Store")
-        
-        # Add monitoring/visualization
-        if CapabilityType.MONITORING in matching_projects:
-            monitor_projs = matching_projects[CapabilityType.MONITORING]
-            grafana = next((p for p in monitor_projs if p.name == "Grafana"), None)
-            if grafana:
-                pattern.add_component(grafana, "Dashboard & Visualization")
-        
-        pattern.tags = ["analytics", "dashboard", "metrics", "visualization"]
+    def _generate_from_template(self, template: Dict[str, Any], intent: Intent,
+                                matching_projects: Dict[CapabilityType, List[OSSProject]]) -> None:
+        """Generate a pattern from a template of capability slots."""
+        components = []
+        get_matches = matching_projects.get
+        get_by_name = self._by_name.get
+        for capability, role, preferred, fallback, required in template["slots"]:
+            projects = get_matches(capability)
+            project = None
+            if projects:
+                # First preferred project present, else optionally the most popular
+                by_name = get_by_name(capability, {})
+                for name in preferred:
+                    project = by_name.get(name)
+                    if project is not None:
+                        break
+                else:
+                    project = projects[0] if fallback else None
+            if project is not None:
+                components.append((project, role))
+            elif required:
+                return
+        
+        pattern = Pattern(name=template["name"], description=template["description"], intent=intent)
+        for project, role in components:
+            pattern.add_component(project, role)
+        pattern.tags = list(template["tags"])
         self.patterns.append(pattern)
     
     def _generate_capability_patterns(self, intent: Intent, 
                                     matching_projects: Dict[CapabilityType, List[OSSProject]]) -> None:
         """Generate patterns based on capability combinations."""
         
-        # Pattern 1: Full Stack Web Application
-        if (CapabilityType.WEB_FRAMEWORK in matching_projects and 
-            CapabilityType.DATABASE in matching_projects):
-            
-            web_projs = matching_projects[CapabilityType.WEB_FRAMEWORK]
-            db_projs = matching_projects[CapabilityType.DATABASE]
-            
-            # Try to find FastAPI + PostgreSQL combination
-            fastapi = next((p for p in web_projs if p.name == "FastAPI"), None)
-            postgres = next((p for p in db_projs if p.name == "PostgreSQL"), None)
-            
-            if fastapi and postgres:
-                pattern = Pattern(
-                    name="Full Stack Python API",
-                    description="Production-ready web API with PostgreSQL database",
-                    intent=intent
-                )
-                pattern.add_component(fastapi, "API Framework")
-                pattern.add_component(postgres, "Primary Database")
-                
-                # Add cache if requested
-                if CapabilityType.CACHE in matching_projects:
-                    cache_projs = matching_projects[CapabilityType.CACHE]
-                    redis = next((p for p in cache_projs if p.name == "Redis"), None)
-                    if redis:
-                        pattern.add_component(redis, "Cache & Session Store")
-                
-                # Add ORM layer if SQLAlchemy available
-                sqlalchemy = next((p for p in db_projs if p.name == "SQLAlchemy"), None)
-                if sqlalchemy:
-                    pattern.add_component(sqlalchemy, "ORM & Data Layer")
-                
-                pattern.tags = ["production", "python", "api", "database"]
-                self.patterns.append(pattern)
+        # Pattern 1: Full Stack Web Application (FastAPI + PostgreSQL)
+        self._generate_from_template(_FULL_STACK_TEMPLATE, intent, matching_projects)
         
         # Pattern 2: Minimal Viable Pattern (one component per capability)
         pattern = Pattern(
@@ -399,26 +526,9 @@ class PatternWeaver:
             intent=intent
         )
         
-        role_map = {
-            CapabilityType.WEB_FRAMEWORK: "Application Framework",
-            CapabilityType.DATABASE: "Data Storage",
-            CapabilityType.CACHE: "Cache Layer",
-            CapabilityType.MESSAGE_QUEUE: "Message Queue",
-            CapabilityType.AI_MODEL: "AI/ML Framework",
-            CapabilityType.AUTHENTICATION: "Authentication",
-            CapabilityType.STORAGE: "File Storage",
-            CapabilityType.MONITORING: "Monitoring",
-            CapabilityType.SEARCH: "Search Engine",
-            CapabilityType.LOAD_BALANCER: "Load Balancer",
-            CapabilityType.EMAIL: "Email Service",
-            CapabilityType.OBJECT_STORAGE: "Object Storage",
-            CapabilityType.PAYMENT: "Payment Processor",
-            CapabilityType.CDN: "CDN",
-        }
-        
         for capability, projects in matching_projects.items():
             if projects:
-                role = role_map.get(capability, capability.value.replace('_', ' ').title())
+                role = _MINIMAL_ROLES.get(capability, capability.value.replace('_', ' ').title())
                 pattern.add_component(projects[0], role)
         
         if pattern.components:  # Only add if we have components
@@ -427,4 +537,19 @@ class PatternWeaver:
 
     def get_all_patterns(self, weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
         """Get all discovered patterns as dictionaries."""
-        return [p.to_dict(self.graph, weights) for p in self.patterns]  
\ No newline at end of file
+        return list(self.iter_patterns(weights))
+    
+    def iter_patterns(self, weights: Optional[Dict[str, float]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield discovered patterns as dictionaries, one at a time."""
+        for pattern in self.patterns:
+            yield pattern.to_dict(self.graph, weights)
+    
+    def get_pattern_views(self, weights: Optional[Dict[str, float]] = None) -> List[PatternView]:
+        """Get all discovered patterns as read-only views (no dict construction)."""
+        return [pattern.to_view(weights) for pattern in self.patterns]
+    
+    def get_top_patterns(self, k: int, weights: Optional[Dict[str, float]] = None) -> List[Pattern]:
+        """Get the k highest-confidence patterns, scoring each one once."""
+        for pattern in self.patterns:
+            pattern.calculate_metrics(weights)
+        return heapq.nlargest(k, self.patterns, key=attrgetter('confidence'))  
\ No newline at end of file
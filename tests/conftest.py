@@ -14,7 +14,6 @@ sys.path.insert(0, str(project_root))
 
 from src.loom.core import OSSProject, CapabilityType, Intent
 from src.loom.graph import SemanticGraph
-from src.loom.weaver import PatternWeaver, calculate_weighted_score
 
 @pytest.fixture
 def sample_projects() -> List[OSSProject]:
@@ -118,4 +118,39 @@ class TestOSSProject:
             ]
         )
         assert len(project.capabilities) == 3
-        assert all(isinstance(c, CapabilityType) for c in project.capabilities)
\ No newline at end of file
+        assert all(isinstance(c, CapabilityType) for c in project.capabilities)
+    
+    def test_capability_caches_follow_edits(self):
+        """Test that the cached capability set and values see in-place edits"""
+        project = OSSProject(name="Editable", capabilities=["database"])
+        assert project.capability_set() == {CapabilityType.DATABASE}
+
+        project.capabilities.append("cache")
+        assert project.capability_set() == {CapabilityType.DATABASE, CapabilityType.CACHE}
+        assert project.capability_values() == ("database", "cache")
+    
+    def test_to_dict(self):
+        """Test serialization to a plain dict"""
+        project = OSSProject(
+            name="Serializable",
+            capabilities=["web_framework", CapabilityType.CACHE]
+        )
+        data = project.to_dict()
+        assert data["name"] == "Serializable"
+        assert data["capabilities"] == ["web_framework", "cache"]
+        assert not any(key.startswith("_") for key in data)
+        assert OSSProject(**data) == project
+    
+    def test_missing_scores(self):
+        """Test that None scores are accepted and score as the 0.5 default"""
+        project = OSSProject(name="Unscored", cost_score=None, security_score=None)
+        assert project.cost_score is None
+        assert project.score_vec() == OSSProject(name="Defaults").score_vec()
+    
+    def test_score_vec_follows_edits(self):
+        """Test that reassigning a score refreshes the cached score vector"""
+        project = OSSProject(name="Edited", security_score=0.2)
+        assert project.score_vec()[0] == 0.2
+
+        project.security_score = 0.9
+        assert project.score_vec()[0] == 0.9
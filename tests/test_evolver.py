@@ -0,0 +1,174 @@
+"""
+Tests for evolver.py - Pattern evolution
+"""
+import json
+import pytest
+from src.loom.core import OSSProject, CapabilityType
+from src.loom.graph import SemanticGraph
+from src.loom.weaver import Pattern
+from src.loom.evolver import PatternEvolver
+
+@pytest.fixture
+def evolver(tmp_path) -> PatternEvolver:
+    """Create an evolver over a graph holding every project the evolution rules refer to"""
+    graph = SemanticGraph(data_dir=str(tmp_path))
+    for name, capability, license, security in [
+        ("FastAPI", CapabilityType.WEB_FRAMEWORK, "MIT", 0.75),
+        ("Django", CapabilityType.WEB_FRAMEWORK, "BSD", 0.85),
+        ("MySQL", CapabilityType.DATABASE, "GPL", 0.78),
+        ("PostgreSQL", CapabilityType.DATABASE, "PostgreSQL", 0.80),
+        ("MongoDB", CapabilityType.DATABASE, "SSPL", 0.70),
+        ("Redis", CapabilityType.CACHE, "BSD", 0.80),
+        ("RabbitMQ", CapabilityType.MESSAGE_QUEUE, "MPL", 0.77),
+        ("Apache_Kafka", CapabilityType.MESSAGE_QUEUE, "Apache 2.0", 0.84),
+        ("Keycloak", CapabilityType.AUTHENTICATION, "Apache 2.0", 0.90),
+        ("Ory_Kratos", CapabilityType.AUTHENTICATION, "Apache 2.0", 0.88),
+        ("Prometheus", CapabilityType.MONITORING, "Apache 2.0", 0.82),
+        ("Grafana", CapabilityType.MONITORING, "AGPL", 0.79),
+    ]:
+        graph.add_project(OSSProject(
+            name=name,
+            capabilities=[capability],
+            license=license,
+            security_score=security
+        ))
+    return PatternEvolver(graph)
+
+def make_pattern(evolver, *components) -> Pattern:
+    """Build a pattern from (project name, role) pairs"""
+    pattern = Pattern("Base", "Base pattern")
+    for name, role in components:
+        pattern.add_component(evolver.graph.projects[name], role)
+    return pattern
+
+def component_names(pattern):
+    return [(project.name, role) for project, role in pattern.components]
+
+class TestLoadPattern:
+    """Test loading patterns and resolving project names"""
+
+    def test_load_pattern_name_variations(self, evolver, tmp_path):
+        """Test that names resolve regardless of case and space/underscore spelling"""
+        pattern_file = tmp_path / "pattern.json"
+        pattern_file.write_text(json.dumps({
+            "name": "Loaded",
+            "description": "From disk",
+            "components": [
+                {"name": "fastapi", "role": "API"},
+                {"name": "POSTGRESQL", "role": "Database"},
+                {"name": "apache kafka", "role": "Events"},
+                {"name": "Ory Kratos", "role": "Auth"},
+            ]
+        }))
+
+        pattern = evolver.load_pattern(str(pattern_file))
+
+        assert pattern.name == "Loaded"
+        assert component_names(pattern) == [
+            ("FastAPI", "API"),
+            ("PostgreSQL", "Database"),
+            ("Apache_Kafka", "Events"),
+            ("Ory_Kratos", "Auth"),
+        ]
+
+    def test_load_pattern_skips_missing_projects(self, evolver, tmp_path):
+        """Test that unknown projects are dropped instead of failing the load"""
+        pattern_file = tmp_path / "pattern.json"
+        pattern_file.write_text(json.dumps({
+            "components": [
+                {"name": "NoSuchProject", "role": "Mystery"},
+                {"name": "Redis"},
+            ]
+        }))
+
+        pattern = evolver.load_pattern(str(pattern_file))
+
+        assert pattern.name == "Unnamed Pattern"
+        assert component_names(pattern) == [("Redis", "Unknown")]
+        assert evolver._get_project("NoSuchProject") is None
+
+    def test_get_project_sees_later_additions(self, evolver):
+        """Test that projects added after the evolver was created are found"""
+        assert evolver._get_project("minio") is None
+
+        evolver.graph.add_project(OSSProject(name="MinIO", capabilities=[CapabilityType.STORAGE]))
+
+        assert evolver._get_project("minio").name == "MinIO"
+
+class TestEvolve:
+    """Test each evolution type"""
+
+    def test_make_scalable(self, evolver):
+        """Test that a web app with a database gains a cache and a message queue"""
+        pattern = make_pattern(evolver, ("FastAPI", "API"), ("MySQL", "Database"))
+
+        evolved = evolver.evolve(pattern, "make-scalable")
+
+        assert evolved.name == "Base (Scalable)"
+        assert component_names(evolved) == [
+            ("FastAPI", "API"),
+            ("MySQL", "Database"),
+            ("Redis", "Cache & Session Storage"),
+            ("RabbitMQ", "Message Queue for Async Processing"),
+        ]
+        assert evolved.tags == ["scalable", "evolved"]
+        assert evolved.transformation_notes == ["Database scalability enhanced"]
+        assert evolved.description.endswith(
+            "Applied: Enhance database for better scalability, Add caching layer for performance, "
+            "Add message queue for async processing"
+        )
+
+    def test_add_security(self, evolver):
+        """Test upgrades to higher-security projects plus added auth and monitoring"""
+        pattern = make_pattern(evolver, ("FastAPI", "API"), ("MySQL", "Database"))
+
+        evolved = evolver.evolve(pattern, "add-security")
+
+        assert component_names(evolved) == [
+            ("Django", "API (Security Enhanced)"),
+            ("PostgreSQL", "Database (Security Enhanced)"),
+            ("Keycloak", "Authentication & Identity Management"),
+            ("Prometheus", "Security Monitoring & Metrics"),
+            ("Grafana", "Security Dashboard & Visualization"),
+        ]
+        assert pattern.average_security_score() == pytest.approx(0.765)
+        assert evolved.average_security_score() == pytest.approx((0.85 + 0.80 + 0.90 + 0.82 + 0.79) / 5)
+        assert evolved.transformation_notes[-1] == "Security score: 0.77→0.83 (+0.07)"
+        assert evolved.tags == ["secure", "evolved", "high_security"]
+
+    def test_optimize_cost(self, evolver):
+        """Test lighter and OSI-licensed replacements and the cost estimate"""
+        pattern = make_pattern(evolver, ("Apache_Kafka", "Events"), ("MongoDB", "Store"), ("Redis", "Cache"))
+
+        evolved = evolver.evolve(pattern, "optimize-cost")
+
+        assert component_names(evolved) == [
+            ("RabbitMQ", "Events (Cost-Optimized)"),
+            ("PostgreSQL", "Store (Cost-Optimized)"),
+            ("Redis", "Cache"),
+        ]
+        # Kafka 1.3 * 0.9, MongoDB 1.5, Redis 0.9 -> RabbitMQ 1.0, PostgreSQL 0.9, Redis 0.9
+        assert evolver._calculate_pattern_cost_score(pattern) == pytest.approx((1.17 + 1.5 + 0.9) / 3 + 0.15)
+        assert evolver._calculate_pattern_cost_score(evolved) == pytest.approx((1.0 + 0.9 + 0.9) / 3 + 0.15)
+        assert evolved.transformation_notes[-1] == "Cost efficiency: 1.34→1.08 (+0.26 savings)"
+        assert evolved.tags == ["cost-optimized", "evolved", "budget_friendly"]
+
+    def test_replacements_added_later(self, tmp_path):
+        """Test that replacement targets added after the evolver was created are proposed"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        graph.add_project(OSSProject(name="Apache_Kafka", capabilities=[CapabilityType.MESSAGE_QUEUE],
+                                     license="Apache 2.0"))
+        evolver = PatternEvolver(graph)
+        pattern = make_pattern(evolver, ("Apache_Kafka", "Events"))
+        assert component_names(evolver.evolve(pattern, "optimize-cost")) == [("Apache_Kafka", "Events")]
+
+        graph.add_project(OSSProject(name="RabbitMQ", capabilities=[CapabilityType.MESSAGE_QUEUE], license="MPL"))
+
+        evolved = evolver.evolve(pattern, "optimize-cost")
+        assert component_names(evolved) == [("RabbitMQ", "Events (Cost-Optimized)")]
+        assert evolver._calculate_pattern_cost_score(evolved) == pytest.approx(1.0 + 0.05)
+
+    def test_unknown_evolution_type(self, evolver):
+        """Test that unknown evolution types are rejected"""
+        with pytest.raises(ValueError):
+            evolver.evolve(Pattern("Empty", "No components"), "make-faster")
@@ -57,6 +57,15 @@ class TestSemanticGraph:
         project_names = [p.name for p in new_projects]
         assert "NewProject" in project_names        
 
+    def test_len_and_project_names(self, test_graph):
+        """Test counting and listing projects without copying them"""
+        assert len(test_graph) == len(test_graph.get_all_projects())
+        assert "FastAPI" in test_graph.project_names()
+
+        test_graph.add_project(OSSProject(name="Flask", capabilities=[CapabilityType.WEB_FRAMEWORK]))
+        assert "Flask" in test_graph.project_names()
+        assert len(test_graph) == len(list(test_graph.project_names()))
+
     def test_find_by_capability(self, test_graph):
         """Test finding projects by capability"""
         # Find web frameworks
@@ -79,6 +88,46 @@ class TestSemanticGraph:
         except (ValueError, AttributeError):
             pass  # Exception is acceptable if that's the design
     
+    def test_find_by_capability_after_replace(self, test_graph):
+        """Test that replacing a project updates the capability index"""
+        test_graph.add_project(OSSProject(
+            name="Redis",
+            description="In-memory data store",
+            capabilities=[CapabilityType.DATABASE]
+        ))
+        
+        assert "Redis" in test_graph.find_by_capability(CapabilityType.DATABASE)
+        assert "Redis" not in test_graph.find_by_capability(CapabilityType.CACHE)
+
+    def test_find_by_capability_after_edit(self, test_graph):
+        """Test that re-adding an edited project moves it in the capability index"""
+        redis = test_graph.get_project("Redis")
+        redis.capabilities[:] = [CapabilityType.DATABASE]
+        test_graph.add_project(redis)
+
+        assert "Redis" in test_graph.find_by_capability(CapabilityType.DATABASE)
+        assert "Redis" not in test_graph.find_by_capability(CapabilityType.CACHE)
+
+    def test_find_by_capability_with_strings(self, test_graph):
+        """Test finding projects by capability value or member name"""
+        expected = test_graph.find_by_capability(CapabilityType.WEB_FRAMEWORK)
+        assert test_graph.find_by_capability("web_framework") == expected
+        assert test_graph.find_by_capability("WEB_FRAMEWORK") == expected
+        assert test_graph.find_by_capability("nonexistent") == []
+
+    def test_projects_by_capability(self, test_graph):
+        """Test that capability matches come back most popular first"""
+        projects = test_graph.projects_by_capability(CapabilityType.WEB_FRAMEWORK)
+        popularity = [p.popularity_score for p in projects]
+        assert popularity == sorted(popularity, reverse=True)
+
+        test_graph.add_project(OSSProject(
+            name="Flask",
+            capabilities=[CapabilityType.WEB_FRAMEWORK],
+            popularity_score=1.0
+        ))
+        assert test_graph.projects_by_capability(CapabilityType.WEB_FRAMEWORK)[0].name == "Flask"
+    
     def test_search(self, test_graph):
         """Test searching projects by query"""
         # Search by name
@@ -106,8 +155,93 @@ class TestSemanticGraph:
         
         # Should have same number of projects
         assert len(new_graph.get_all_projects()) == len(test_graph.get_all_projects())
-    
-   
+
+    def test_save_after_editing_project(self, tmp_path, sample_projects):
+        """Test that in-place edits to a project's capabilities are saved"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        graph.add_project(sample_projects[0])
+        sample_projects[0].capabilities.append(CapabilityType.CACHE)
+        graph._save()
+
+        saved = json.loads((tmp_path / "projects.json").read_text())
+        assert saved["FastAPI"]["capabilities"] == ["web_framework", "cache"]
+
+    def test_save_skips_unchanged_content(self, tmp_path, sample_projects):
+        """Test that saving identical content leaves the file untouched"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        for project in sample_projects:
+            graph.add_project(project)
+        graph._save()
+
+        projects_file = tmp_path / "projects.json"
+        mtime = projects_file.stat().st_mtime_ns
+        graph._save()
+
+        assert projects_file.stat().st_mtime_ns == mtime
+        assert not (tmp_path / "projects.json.tmp").exists()
+
+    def test_add_project_waits_for_flush(self, tmp_path, sample_projects):
+        """Test that mutations are only written to disk by flush()"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        graph.add_project(sample_projects[0])
+        projects_file = tmp_path / "projects.json"
+        assert not projects_file.exists()
+
+        graph.flush()
+        assert "FastAPI" in json.loads(projects_file.read_text())
+
+    def test_batch_saves_once_on_exit(self, tmp_path, sample_projects, monkeypatch):
+        """Test that batch() writes a single time when the block exits"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        saves = []
+        original_save = graph._save
+        monkeypatch.setattr(graph, "_save", lambda: saves.append(1) or original_save())
+
+        with graph.batch():
+            for project in sample_projects:
+                graph.add_project(project)
+            assert saves == []
+
+        assert saves == [1]
+        assert len(json.loads((tmp_path / "projects.json").read_text())) == len(sample_projects)
+
+    def test_batch_saves_when_block_raises(self, tmp_path, sample_projects):
+        """Test that a failing batch still saves the mutations applied before the error"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+
+        with pytest.raises(RuntimeError):
+            with graph.batch():
+                graph.add_project(sample_projects[0])
+                raise RuntimeError("interrupted")
+
+        assert list(json.loads((tmp_path / "projects.json").read_text())) == ["FastAPI"]
+        assert not graph._dirty
+
+    def test_flush_without_changes_does_nothing(self, tmp_path, sample_projects, monkeypatch):
+        """Test that flush() skips saving when nothing is pending"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        graph.add_project(sample_projects[0])
+        graph.flush()
+
+        monkeypatch.setattr(graph, "_save", lambda: pytest.fail("unexpected save"))
+        graph.flush()
+
+    def test_flush_retries_after_failed_write(self, tmp_path, sample_projects, monkeypatch):
+        """Test that changes stay pending when a write fails"""
+        graph = SemanticGraph(data_dir=str(tmp_path))
+        graph.add_project(sample_projects[0])
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr("src.loom.graph.os.replace", fail_replace)
+            with pytest.raises(OSError):
+                graph.flush()
+
+        graph.flush()
+        assert "FastAPI" in json.loads((tmp_path / "projects.json").read_text())
+
     def test_get_stats(self, test_graph):
         """Test getting graph statistics"""
         stats = test_graph.get_stats()
@@ -1,8 +1,9 @@
 """
 Tests for weaver.py - Pattern weaving and scoring
 """
+import os
 import pytest
-from src.loom.core import CapabilityType
+from src.loom.core import CapabilityType, OSSProject, Relationship, RelationshipType
 from src.loom.weaver import PatternWeaver, Pattern, calculate_weighted_score
 
 class TestWeightedScoreCalculation:
@@ -37,6 +38,13 @@ class TestWeightedScoreCalculation:
         expected = (0.4*0.85 + 0.15*(1-0.4) + 0.15*(1-0.3) + 0.2*0.9 + 0.1*(1-0.2))
         assert score == pytest.approx(expected)
     
+    def test_score_follows_project_edits(self, sample_projects):
+        """Test that scores use a project's current values"""
+        weights = {'security': 1.0, 'cost': 0, 'complexity': 0, 'maturity': 0, 'license_risk': 0}
+        assert calculate_weighted_score([sample_projects[0]], weights) == pytest.approx(0.85)
+        sample_projects[0].security_score = 0.2
+        assert calculate_weighted_score([sample_projects[0]], weights) == pytest.approx(0.2)
+    
     def test_empty_components(self):
         """Test with empty component list"""
         score = calculate_weighted_score([], {})
@@ -61,8 +69,9 @@ class TestPatternWeaver:
         for pattern in patterns:
             assert isinstance(pattern, Pattern)
             # Print debug info
-            print(f"\nPattern: {pattern.name}")
-            print(f"Components: {[(c[0].name, c[1]) for c in pattern.components]}")
+            if os.getenv('LOOM_TEST_VERBOSE'):
+                print(f"\nPattern: {pattern.name}")
+                print(f"Components: {[(c[0].name, c[1]) for c in pattern.components]}")
             components = [c[0].name for c in pattern.components]
             assert any('FastAPI' in comp or 'Django' in comp for comp in components)
             assert any('PostgreSQL' in comp or 'MySQL' in comp for comp in components)       
@@ -98,6 +107,35 @@ class TestPatternWeaver:
         default_dict = weaver.get_all_patterns()
         assert patterns_dict[0]["confidence"] != default_dict[0]["confidence"]
 
+    def test_weave_results_cached_across_weavers(self, test_graph, sample_intent):
+        """Test that cached weaves return fresh patterns and follow graph changes"""
+        first = PatternWeaver(test_graph, sample_intent).weave_for_intent(sample_intent)
+        first[0].add_component(first[0].components[0][0], "Extra")
+        
+        second = PatternWeaver(test_graph, sample_intent).weave_for_intent(sample_intent)
+        assert [p.name for p in second] == [p.name for p in first]
+        assert second[0] is not first[0]
+        assert len(second[0].components) == len(first[0].components) - 1
+        
+        test_graph.add_project(OSSProject(
+            name="Flask",
+            capabilities=[CapabilityType.WEB_FRAMEWORK],
+            popularity_score=1.0
+        ))
+        third = PatternWeaver(test_graph, sample_intent).weave_for_intent(sample_intent)
+        minimal = next(p for p in third if p.name == "Minimal Viable Architecture")
+        assert "Flask" in [project.name for project, _ in minimal.components]
+
+    def test_get_top_patterns(self, test_graph, sample_intent):
+        """Test getting the highest-confidence patterns"""
+        weaver = PatternWeaver(test_graph, sample_intent)
+        patterns = weaver.weave_for_intent(sample_intent)
+
+        top = weaver.get_top_patterns(1)
+
+        assert len(top) == 1
+        assert top[0].confidence == max(p.confidence for p in patterns)
+
 class TestPattern:
     """Test the Pattern class"""
     
@@ -134,6 +172,74 @@ class TestPattern:
         assert pattern.confidence > 0
         assert pattern.complexity > 0
     
+    def test_pattern_metrics_follow_component_changes(self, sample_projects):
+        """Test that memoized metrics are recomputed after adding a component"""
+        pattern = Pattern("Test", "With components")
+        pattern.add_component(sample_projects[0], "API")
+        pattern.calculate_metrics()
+        single = pattern.complexity
+        
+        pattern.add_component(sample_projects[2], "DB")
+        pattern.calculate_metrics()
+        
+        expected = (sample_projects[0].complexity_score + sample_projects[2].complexity_score) / 2
+        assert pattern.complexity == pytest.approx(expected)
+        assert single == pytest.approx(sample_projects[0].complexity_score)
+    
+    def test_capability_set_follows_project_edits(self, sample_projects):
+        """Test that the capability union sees edited project capabilities"""
+        pattern = Pattern("Test", "Capability union")
+        pattern.add_component(sample_projects[4], "Cache")
+        assert pattern.capability_set() == {CapabilityType.CACHE}
+
+        sample_projects[4].capabilities.append(CapabilityType.DATABASE)
+        assert pattern.capability_set() == {CapabilityType.CACHE, CapabilityType.DATABASE}
+    
+    def test_pattern_metrics_follow_intent_and_score_edits(self, sample_projects, sample_intent):
+        """Test that memoized metrics see in-place intent and project score changes"""
+        pattern = Pattern("Test", "Memo inputs", intent=sample_intent)
+        pattern.add_component(sample_projects[0], "API")
+        pattern.calculate_metrics()
+        base = pattern.confidence
+
+        sample_intent.required_capabilities.append(CapabilityType.HIGH_SECURITY)
+        pattern.calculate_metrics()
+        boosted = pattern.confidence
+        assert boosted > base
+
+        sample_projects[0].security_score = 0.1
+        pattern.calculate_metrics()
+        assert pattern.confidence < boosted
+    
+    def test_pattern_components_are_read_only(self, sample_projects):
+        """Test that components can only change through add/remove_component"""
+        pattern = Pattern("Test", "Read-only components")
+        pattern.add_component(sample_projects[0], "API")
+        pattern.add_component(sample_projects[2], "DB")
+        with pytest.raises(AttributeError):
+            pattern.components.pop()
+        with pytest.raises(AttributeError):
+            pattern.components = ()
+
+        assert pattern.remove_component("PostgreSQL")
+        pattern.calculate_metrics()
+        assert not pattern.has_component("PostgreSQL")
+        assert pattern.components == ((sample_projects[0], "API"),)
+        assert pattern.complexity == pytest.approx(sample_projects[0].complexity_score)
+    
+    def test_pattern_to_view(self, sample_projects):
+        """Test the cached read-only pattern view"""
+        pattern = Pattern("View Test", "Testing to_view")
+        pattern.add_component(sample_projects[0], "API")
+
+        view = pattern.to_view()
+        assert view.name == "View Test"
+        assert view.components[0][1] == "API"
+        assert pattern.to_view() is view
+
+        pattern.add_component(sample_projects[2], "Database")
+        assert len(pattern.to_view().components) == 2
+
     def test_pattern_to_dict(self, test_graph, sample_projects):
         """Test converting pattern to dictionary"""
         pattern = Pattern("Dict Test", "Testing to_dict")
@@ -145,4 +251,24 @@ class TestPattern:
         assert pattern_dict["name"] == "Dict Test"
         assert len(pattern_dict["components"]) == 2
         assert "confidence" in pattern_dict
-        assert "complexity" in pattern_dict
\ No newline at end of file
+        assert "complexity" in pattern_dict
+
+    def test_pattern_connections_follow_graph_changes(self, test_graph, sample_projects):
+        """Test that cached connections are rebuilt when the graph changes"""
+        pattern = Pattern("Connections", "Testing connection cache")
+        pattern.add_component(sample_projects[0], "API")
+        pattern.add_component(sample_projects[2], "Database")
+        
+        assert pattern.to_dict(test_graph)["connections"] == []
+        
+        test_graph.add_relationship(Relationship(
+            source="FastAPI",
+            target="PostgreSQL",
+            relationship_type=RelationshipType.COMPATIBLE_WITH,
+            strength=0.9
+        ))
+        connections = pattern.to_dict(test_graph)["connections"]
+        
+        assert len(connections) == 1
+        assert connections[0]["from"] == "FastAPI"
+        assert connections[0]["to"] == "PostgreSQL"